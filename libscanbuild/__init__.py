@@ -22,20 +22,59 @@ ENVIRONMENT_KEY = 'INTERCEPT_BUILD'
 
 Execution = collections.namedtuple('Execution', ['pid', 'cwd', 'cmd'])
 
+# characters which make the shell lexer necessary to split a command.
+SHELL_QUOTING_PATTERN = re.compile(r'["\'\\]')
+# the tokens of a command string which has no quoting at all.
+SHELL_TOKEN_PATTERN = re.compile(r'[^ \t\r\n]+')
+# the escaped characters within double quotes and outside of quotes.
+QUOTED_ESCAPE_PATTERN = re.compile(r'\\(["\\])')
+UNQUOTED_ESCAPE_PATTERN = re.compile(r'\\([\\ $%&\(\)\[\]\{\}\*|<>@?!])')
+
+
+def json_loads(content):
+    # type: (bytes) -> Any
+    """ Parse a JSON document, like a compilation database. """
+
+    return json_loader()(content)
+
+
+@functools.lru_cache(maxsize=1)
+def json_loader():
+    # type: () -> Callable[[bytes], Any]
+    """ Returns the orjson parser when installed, the standard one otherwise.
+
+    It's optional, but parses large compilation databases much faster. The
+    import is done on the first use, the compiler wrappers never need it. """
+
+    try:
+        from orjson import loads  # type: ignore
+    except ImportError:
+        loads = json.loads
+    return loads
+
+
+def shell_unescape(arg):
+    # type: (str) -> str
+    """ Gets rid of the escaping characters. """
+
+    if len(arg) >= 2 and arg[0] == arg[-1] and arg[0] == '"':
+        arg = arg[1:-1]
+        return QUOTED_ESCAPE_PATTERN.sub(r'\1', arg) if '\\' in arg else arg
+    if '\\' not in arg:
+        return arg
+    return UNQUOTED_ESCAPE_PATTERN.sub(r'\1', arg)
+
 
 def shell_split(string):
     # type: (str) -> List[str]
-    """ Takes a command string and returns as a list. """
+    """ Takes a command string and returns as a list.
 
-    def unescape(arg):
-        # type: (str) -> str
-        """ Gets rid of the escaping characters. """
+    Most commands are not quoted or escaped, those are split by whitespace
+    without running the (slow) shell lexer. """
 
-        if len(arg) >= 2 and arg[0] == arg[-1] and arg[0] == '"':
-            return re.sub(r'\\(["\\])', r'\1', arg[1:-1])
-        return re.sub(r'\\([\\ $%&\(\)\[\]\{\}\*|<>@?!])', r'\1', arg)
-
-    return [unescape(token) for token in shlex.split(string)]
+    if not SHELL_QUOTING_PATTERN.search(string):
+        return SHELL_TOKEN_PATTERN.findall(string)
+    return [shell_unescape(token) for token in shlex.split(string)]
 
 
 def run_build(command, *args, **kwargs):
@@ -46,9 +85,12 @@ def run_build(command, *args, **kwargs):
     :return: exit code of the process
     """
     environment = kwargs.get('env', os.environ)
-    logging.debug('run build %s, in environment:\n%s',
-                  command,
-                  pprint.pformat(environment, indent=1, width=79))
+    # pretty printing the whole environment is expensive, do it only when
+    # it will be seen.
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug('run build %s, in environment:\n%s',
+                      command,
+                      pprint.pformat(environment, indent=1, width=79))
     exit_code = subprocess.call(command, *args, **kwargs)
     logging.debug('build finished with exit code: %d', exit_code)
     return exit_code
@@ -62,22 +104,16 @@ def run_command(command, cwd=None):
     :param cwd: the working directory where the command will be executed
     :return: output of the command
     """
-    def decode_when_needed(result):
-        # type: (Any) -> str
-        """ check_output returns bytes or string depend on python version """
-        if not isinstance(result, str):
-            return result.decode('utf-8')
-        return result
-
     try:
         directory = os.path.abspath(cwd) if cwd else os.getcwd()
         logging.debug('exec command %s in %s', command, directory)
         output = subprocess.check_output(command,
                                          cwd=directory,
-                                         stderr=subprocess.STDOUT)
-        return decode_when_needed(output).splitlines()
+                                         stderr=subprocess.STDOUT,
+                                         encoding='utf-8')
+        return output.splitlines()
     except subprocess.CalledProcessError as ex:
-        ex.output = decode_when_needed(ex.output).splitlines()
+        ex.output = ex.output.splitlines()
         raise ex
 
 
@@ -169,7 +205,8 @@ def wrapper_entry_point(function):
         but might have `.exe` extension on windows. """
 
         wrapper_command = os.path.basename(sys.argv[0])
-        return True if re.match(r'(.+)c\+\+(.*)', wrapper_command) else False
+        # same as matching '(.+)c\+\+(.*)', without the regex engine
+        return wrapper_command.find('c++', 1) != -1
 
     def run_compiler(executable):
         # type: (List[str]) -> int
@@ -16,7 +16,6 @@ import os
 import os.path
 import json
 import logging
-import multiprocessing
 import tempfile
 import functools
 import subprocess
@@ -31,7 +30,6 @@ from libscanbuild import command_entry_point, wrapper_entry_point, \
 from libscanbuild.arguments import parse_args_for_scan_build, \
     parse_args_for_analyze_build
 from libscanbuild.intercept import capture
-from libscanbuild.report import document
 from libscanbuild.compilation import Compilation, classify_source, \
     CompilationDatabase
 from libscanbuild.clang import get_version, get_arguments
@@ -66,7 +64,9 @@ def scan_build():
             # run build command and analyzer with compiler wrappers
             environment = setup_environment(args)
             exit_code = run_build(args.build, env=environment)
-        # cover report generation and bug counting
+        # cover report generation and bug counting (imported here, to keep
+        # the compiler wrapper startup free of the report dependencies)
+        from libscanbuild.report import document
         number_of_bugs = document(args)
         # set exit status as it was requested
         return number_of_bugs if args.status_bugs else exit_code
@@ -83,7 +83,9 @@ def analyze_build():
         # run the analyzer against a compilation db
         compilations = CompilationDatabase.load(args.cdb)
         run_analyzer_parallel(compilations, args)
-        # cover report generation and bug counting
+        # cover report generation and bug counting (imported here, to keep
+        # the compiler wrapper startup free of the report dependencies)
+        from libscanbuild.report import document
         number_of_bugs = document(args)
         # set exit status as it was requested
         return number_of_bugs if args.status_bugs else 0
@@ -172,18 +174,43 @@ def run_analyzer_parallel(compilations, args):
     # type: (Iterable[Compilation], argparse.Namespace) -> None
     """ Runs the analyzer against the given compilations. """
 
+    # local import: keeps it off the startup of the compiler wrappers
+    import multiprocessing
+
     logging.debug('run analyzer against compilation database')
     consts = analyze_parameters(args)
-    parameters = (dict(compilation.as_dict(), **consts)
-                  for compilation in compilations)
+    parameters = (compilation.as_dict() for compilation in compilations)
     # when verbose output requested execute sequentially
-    pool = multiprocessing.Pool(1 if args.verbose > 2 else None)
-    for current in pool.imap_unordered(run, parameters):
+    pool = multiprocessing.Pool(1 if args.verbose > 2 else None,
+                                initializer=set_common_parameters,
+                                initargs=(consts,))
+    for current in pool.imap_unordered(run_with_common_parameters,
+                                       parameters):
         logging_analyzer_output(current)
     pool.close()
     pool.join()
 
 
+# The analyzer parameters which are the same for every compilation. Worker
+# processes receive these once (at start) instead of with every task.
+COMMON_PARAMETERS = dict()  # type: Dict[str, Any]
+
+
+def set_common_parameters(consts):
+    # type: (Dict[str, Any]) -> None
+    """ Worker process initializer, stores the common analyzer parameters. """
+
+    COMMON_PARAMETERS.clear()
+    COMMON_PARAMETERS.update(consts)
+
+
+def run_with_common_parameters(compilation):
+    # type: (Dict[str, Any]) -> Dict[str, Any]
+    """ Run the analyzer against a single compilation in a worker process. """
+
+    return run(dict(compilation, **COMMON_PARAMETERS))
+
+
 def setup_environment(args):
     # type: (argparse.Namespace) -> Dict[str, str]
     """ Set up environment for build command to interpose compiler wrapper. """
@@ -244,7 +271,10 @@ def report_directory(hint, keep):
     try:
         yield name
     finally:
-        if os.listdir(name):
+        # stop at the first entry, no need to list the whole directory.
+        with os.scandir(name) as entries:
+            has_reports = next(entries, None) is not None
+        if has_reports:
             msg = "Run 'scan-view %s' to examine bug reports."
             keep = True
         else:
@@ -262,9 +292,13 @@ def require(required):
     """ Decorator for checking the required values in state.
 
     It checks the required attributes in the passed state and stop when
-    any of those is missing. """
+    any of those is missing. The check is an assertion, so with optimization
+    enabled (python -O) the method is not wrapped at all. """
 
     def decorator(method):
+        if not __debug__:
+            return method
+
         @functools.wraps(method)
         def wrapper(*args, **kwargs):
             for key in required:
@@ -303,8 +337,9 @@ def run(opts):
     decorator. It's like an 'assert' to check the contract between the
     caller and the called method.) """
 
-    command = [opts['compiler'], '-c'] + opts['flags'] + [opts['source']]
-    logging.debug("Run analyzer against '%s'", command)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        command = [opts['compiler'], '-c'] + opts['flags'] + [opts['source']]
+        logging.debug("Run analyzer against '%s'", command)
     return exclude(opts)
 
 
@@ -339,8 +374,7 @@ def report_failure(opts):
         """ Creates failures directory if not exits yet. """
 
         failures_dir = os.path.join(opts['output_dir'], 'failures')
-        if not os.path.isdir(failures_dir):
-            os.makedirs(failures_dir)
+        os.makedirs(failures_dir, exist_ok=True)
         return failures_dir
 
     # Classify error type: when Clang terminated by a signal it's a 'Crash'.
@@ -364,7 +398,7 @@ def report_failure(opts):
             handle.write(opts['source'] + os.linesep)
             handle.write(error.title().replace('_', ' ') + os.linesep)
             handle.write(' '.join(cmd) + os.linesep)
-            handle.write(' '.join(platform.uname()) + os.linesep)
+            handle.write(uname() + os.linesep)
             handle.write(get_version(opts['clang']))
             handle.close()
         # write the captured output too
@@ -376,6 +410,14 @@ def report_failure(opts):
         logging.warning('failed to report failure', exc_info=True)
 
 
+@functools.lru_cache(maxsize=1)
+def uname():
+    # type: () -> str
+    """ Returns the host system information, like `uname -a` would print. """
+
+    return ' '.join(os.uname() if hasattr(os, 'uname') else platform.uname())
+
+
 @require(['clang', 'directory', 'flags', 'direct_args', 'source', 'output_dir',
           'output_format'])
 def run_analyzer(opts, continuation=report_failure):
@@ -427,17 +469,19 @@ def filter_debug_flags(opts, continuation=run_analyzer):
     return continuation(opts)
 
 
+# Languages which the analyzer accepts.
+ACCEPTED_LANGUAGES = frozenset({
+    'c', 'c++', 'objective-c', 'objective-c++', 'c-cpp-output',
+    'c++-cpp-output', 'objective-c-cpp-output'
+})
+
+
 @require(['language', 'compiler', 'source', 'flags'])
 def language_check(opts, continuation=filter_debug_flags):
     # type: (...) -> Dict[str, Any]
     """ Find out the language from command line parameters or file name
     extension. The decision also influenced by the compiler invocation. """
 
-    accepted = frozenset({
-        'c', 'c++', 'objective-c', 'objective-c++', 'c-cpp-output',
-        'c++-cpp-output', 'objective-c-cpp-output'
-    })
-
     # language can be given as a parameter...
     language = opts.pop('language')
     compiler = opts.pop('compiler')
@@ -448,7 +492,7 @@ def language_check(opts, continuation=filter_debug_flags):
     if language is None:
         logging.debug('skip analysis, language not known')
         return dict()
-    elif language not in accepted:
+    elif language not in ACCEPTED_LANGUAGES:
         logging.debug('skip analysis, language not supported')
         return dict()
 
@@ -458,17 +502,20 @@ def language_check(opts, continuation=filter_debug_flags):
     return continuation(opts)
 
 
+# Architectures which the analyzer does not support.
+DISABLED_ARCHITECTURES = frozenset({'ppc', 'ppc64'})
+
+
 @require(['arch_list', 'flags'])
 def arch_check(opts, continuation=language_check):
     # type: (...) -> Dict[str, Any]
     """ Do run analyzer through one of the given architectures. """
 
-    disabled = frozenset({'ppc', 'ppc64'})
-
     received_list = opts.pop('arch_list')
     if received_list:
         # filter out disabled architectures and -arch switches
-        filtered_list = [a for a in received_list if a not in disabled]
+        filtered_list = [a for a in received_list
+                         if a not in DISABLED_ARCHITECTURES]
         if filtered_list:
             # There should be only one arch given (or the same multiple
             # times). If there are multiple arch are given and are not
@@ -524,6 +571,10 @@ IGNORED_FLAGS = {
     '--serialize-diagnostics': 1
 }  # type: Dict[str, int]
 
+# Extra warning flags are dropped from the analyzer run, but the ones which
+# suppress a warning are kept.
+WARNING_FLAG_PATTERN = re.compile(r'^-W(?!no-.).+')
+
 
 @require(['flags'])
 def classify_parameters(opts, continuation=target_check):
@@ -554,7 +605,7 @@ def classify_parameters(opts, continuation=target_check):
                 next(args)
         # we don't care about extra warnings, but we should suppress ones
         # that we don't want to see.
-        elif re.match(r'^-W.+', arg) and not re.match(r'^-Wno-.+', arg):
+        elif WARNING_FLAG_PATTERN.match(arg):
             pass
         # and consider everything else as compilation flag.
         else:
@@ -564,21 +615,22 @@ def classify_parameters(opts, continuation=target_check):
     return continuation(opts)
 
 
+def contains(directory, entry):
+    # type: (str, str) -> bool
+    """ Check is directory contains the given file. """
+
+    # When a directory contains a file, then the relative path to the
+    # file from that directory does not start with a parent dir prefix.
+    relative = os.path.relpath(entry, directory).split(os.sep)
+    return len(relative) > 0 and relative[0] != os.pardir
+
+
 @require(['source', 'excludes'])
 def exclude(opts, continuation=classify_parameters):
     # type: (...) -> Dict[str, Any]
     """ Analysis might be skipped, when one of the requested excluded
     directory contains the file. """
 
-    def contains(directory, entry):
-        # type: (str, str) -> bool
-        """ Check is directory contains the given file. """
-
-        # When a directory contains a file, then the relative path to the
-        # file from that directory does not start with a parent dir prefix.
-        relative = os.path.relpath(entry, directory).split(os.sep)
-        return len(relative) > 0 and relative[0] != os.pardir
-
     if any(contains(entry, opts['source']) for entry in opts['excludes']):
         logging.debug('skip analysis, file requested to exclude')
         return dict()
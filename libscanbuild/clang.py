@@ -9,6 +9,8 @@ Since Clang command line interface is so rich, but this project is using only
 a subset of that, it makes sense to create a function specific wrapper. """
 
 import re
+import functools
+import concurrent.futures
 from typing import List, Set, FrozenSet, Callable   # noqa: ignore=F401
 from typing import Iterable, Tuple, Dict            # noqa: ignore=F401
 
@@ -19,7 +21,23 @@ __all__ = ['get_version', 'get_arguments', 'get_checkers']
 # regex for activated checker
 ACTIVE_CHECKER_PATTERN = re.compile(r'^-analyzer-checker=(.*)$')
 
+# regex for the error message of the clang driver
+DRIVER_ERROR_PATTERN = re.compile(r'clang(.*): error:')
 
+# regex for the '-###' output, where every argument is double quoted and
+# the '"', '\\' and '$' characters are escaped with a backslash.
+QUOTED_ARGUMENTS_PATTERN = re.compile(r'^(?:\s*"(?:[^"\\]|\\.)*")*\s*$')
+QUOTED_ARGUMENT_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"')
+ESCAPED_CHARACTER_PATTERN = re.compile(r'\\(.)')
+
+# regexes for the '-analyzer-checker-help' output
+CHECKERS_HEADER_PATTERN = re.compile(r'^CHECKERS:')
+CHECKER_CONTINUATION_PATTERN = re.compile(r'^\s\s\S')
+CHECKER_NAME_PATTERN = re.compile(r'^\s\s\S+$')
+CHECKER_ENTRY_PATTERN = re.compile(r'^\s\s(?P<key>\S*)\s*(?P<value>.*)')
+
+
+@functools.lru_cache(maxsize=8)
 def get_version(clang):
     # type: (str) -> str
     """ Returns the compiler version as string.
@@ -40,16 +58,28 @@ def get_arguments(command, cwd):
     :param cwd:     the current working directory
     :return:        the detailed front-end invocation command """
 
-    cmd = command[:]
-    cmd.insert(1, '-###')
+    cmd = command[:1] + ['-###'] + command[1:]
 
     output = run_command(cmd, cwd=cwd)
     # The relevant information is in the last line of the output.
     # Don't check if finding last line fails, would throw exception anyway.
     last_line = output[-1]
-    if re.search(r'clang(.*): error:', last_line):
+    if DRIVER_ERROR_PATTERN.search(last_line):
         raise Exception(last_line)
-    return shell_split(last_line)
+    return split_arguments(last_line)
+
+
+def split_arguments(line):
+    # type: (str) -> List[str]
+    """ Takes the front-end invocation printed by Clang and returns as a list.
+
+    Clang quotes all arguments the same simple way, which does not need the
+    shell lexer. Anything else is left to the generic shell_split. """
+
+    if not QUOTED_ARGUMENTS_PATTERN.match(line):
+        return shell_split(line)
+    return [ESCAPED_CHARACTER_PATTERN.sub(r'\1', arg) if '\\' in arg else arg
+            for arg in QUOTED_ARGUMENT_PATTERN.findall(line)]
 
 
 def get_active_checkers(clang, plugins):
@@ -78,9 +108,12 @@ def get_active_checkers(clang, plugins):
                                   for arg in get_arguments(cmd, '.'))
                 if candidate]
 
+    # the queries are independent clang processes, run them simultaneously
+    languages = ['c', 'c++', 'objective-c', 'objective-c++']
     result = set()  # type: Set[str]
-    for language in ['c', 'c++', 'objective-c', 'objective-c++']:
-        result.update(get_active_checkers_for(language))
+    with concurrent.futures.ThreadPoolExecutor(len(languages)) as executor:
+        for checkers in executor.map(get_active_checkers_for, languages):
+            result.update(checkers)
     return frozenset(result)
 
 
@@ -93,9 +126,16 @@ def is_active(checkers):
         # type: (str) -> bool
         """ Returns True if the given checker is active. """
 
-        return any(pattern.match(checker) for pattern in patterns)
+        # look up the name, then each of its parent groups ('a.b.c', 'a.b',
+        # 'a'), which costs as many lookups as the name has components.
+        while checker not in names:
+            separator = checker.rfind('.')
+            if separator < 0:
+                return False
+            checker = checker[:separator]
+        return True
 
-    patterns = [re.compile(r'^' + a + r'(\.|$)') for a in checkers]
+    names = frozenset(checkers)
     return predicate
 
 
@@ -120,19 +160,18 @@ def parse_checkers(stream):
     lines = iter(stream)
     # find checkers header
     for line in lines:
-        if re.match(r'^CHECKERS:', line):
+        if CHECKERS_HEADER_PATTERN.match(line):
             break
     # find entries
     state = None
     for line in lines:
-        if state and not re.match(r'^\s\s\S', line):
+        if state and not CHECKER_CONTINUATION_PATTERN.match(line):
             yield (state, line.strip())
             state = None
-        elif re.match(r'^\s\s\S+$', line.rstrip()):
+        elif CHECKER_NAME_PATTERN.match(line.rstrip()):
             state = line.strip()
         else:
-            pattern = re.compile(r'^\s\s(?P<key>\S*)\s*(?P<value>.*)')
-            match = pattern.match(line.rstrip())
+            match = CHECKER_ENTRY_PATTERN.match(line.rstrip())
             if match:
                 current = match.groupdict()
                 yield (current['key'], current['value'])
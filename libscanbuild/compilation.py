@@ -14,8 +14,7 @@ import subprocess
 from typing import List, Iterable, Dict, Tuple, Type, Any  # noqa: ignore=F401
 from typing import Optional  # noqa: ignore=F401
 
-from libscanbuild import Execution, shell_split, run_command
-
+from libscanbuild import Execution, shell_split, run_command, json_loads
 
 __all__ = ['classify_source', 'Compilation', 'CompilationDatabase']
 
@@ -63,6 +62,12 @@ IGNORED_FLAGS = {
 
 }  # type: Dict[str, int]
 
+# Linker flags with attached value, ignored by the same reason as above.
+LINKER_FLAG_PATTERN = re.compile(r'^-(l|L|Wl,).+')
+
+# Parameters which might be a source file name.
+SOURCE_FILE_PATTERN = re.compile(r'^[^-].+')
+
 # Known C/C++ compiler wrapper name patterns.
 COMPILER_PATTERN_WRAPPER = re.compile(r'^(distcc|ccache)$')
 
@@ -70,21 +75,47 @@ COMPILER_PATTERN_WRAPPER = re.compile(r'^(distcc|ccache)$')
 COMPILER_PATTERNS_MPI_WRAPPER = re.compile(r'^mpi(cc|cxx|CC|c\+\+)$')
 
 # Known C compiler executable name patterns.
-COMPILER_PATTERNS_CC = (
-    re.compile(r'^([^-]*-)*[mg]cc(-\d+(\.\d+){0,2})?$'),
-    re.compile(r'^([^-]*-)*clang(-\d+(\.\d+){0,2})?$'),
-    re.compile(r'^(|i)cc$'),
-    re.compile(r'^(g|)xlc$'),
-)
+COMPILER_PATTERNS_CC = re.compile('|'.join([
+    r'^([^-]*-)*[mg]cc(-\d+(\.\d+){0,2})?$',
+    r'^([^-]*-)*clang(-\d+(\.\d+){0,2})?$',
+    r'^(|i)cc$',
+    r'^(g|)xlc$',
+]))
 
 # Known C++ compiler executable name patterns.
-COMPILER_PATTERNS_CXX = (
-    re.compile(r'^(c\+\+|cxx|CC)$'),
-    re.compile(r'^([^-]*-)*[mg]\+\+(-\d+(\.\d+){0,2})?$'),
-    re.compile(r'^([^-]*-)*clang\+\+(-\d+(\.\d+){0,2})?$'),
-    re.compile(r'^icpc$'),
-    re.compile(r'^(g|)xl(C|c\+\+)$'),
-)
+COMPILER_PATTERNS_CXX = re.compile('|'.join([
+    r'^(c\+\+|cxx|CC)$',
+    r'^([^-]*-)*[mg]\+\+(-\d+(\.\d+){0,2})?$',
+    r'^([^-]*-)*clang\+\+(-\d+(\.\d+){0,2})?$',
+    r'^icpc$',
+    r'^(g|)xl(C|c\+\+)$',
+]))
+
+# Map of source file extensions to languages, when compiled by C compiler.
+SOURCE_LANGUAGES_C = {
+    '.c': 'c',
+    '.i': 'c-cpp-output',
+    '.ii': 'c++-cpp-output',
+    '.m': 'objective-c',
+    '.mi': 'objective-c-cpp-output',
+    '.mm': 'objective-c++',
+    '.mii': 'objective-c++-cpp-output',
+    '.C': 'c++',
+    '.cc': 'c++',
+    '.CC': 'c++',
+    '.cp': 'c++',
+    '.cpp': 'c++',
+    '.cxx': 'c++',
+    '.c++': 'c++',
+    '.C++': 'c++',
+    '.txx': 'c++'
+}  # type: Dict[str, str]
+
+# The same map, when compiled by C++ compiler.
+SOURCE_LANGUAGES_CXX = dict(SOURCE_LANGUAGES_C, **{
+    '.c': 'c++',
+    '.i': 'c++-cpp-output'
+})  # type: Dict[str, str]
 
 CompilationCommand = collections.namedtuple(
     'CompilationCommand', ['compiler', 'flags', 'files'])
@@ -190,24 +221,6 @@ class Compilation:
         :return: None if the command is not a compilation, or a tuple
                 (compiler_language, rest of the command) otherwise """
 
-        def is_wrapper(cmd):
-            # type: (str) -> bool
-            return True if COMPILER_PATTERN_WRAPPER.match(cmd) else False
-
-        def is_mpi_wrapper(cmd):
-            # type: (str) -> bool
-            return True if COMPILER_PATTERNS_MPI_WRAPPER.match(cmd) else False
-
-        def is_c_compiler(cmd):
-            # type: (str) -> bool
-            return os.path.basename(cc) == cmd or \
-                any(pattern.match(cmd) for pattern in COMPILER_PATTERNS_CC)
-
-        def is_cxx_compiler(cmd):
-            # type: (str) -> bool
-            return os.path.basename(cxx) == cmd or \
-                any(pattern.match(cmd) for pattern in COMPILER_PATTERNS_CXX)
-
         if command:  # not empty list will allow to index '0' and '1:'
             executable = os.path.basename(command[0])  # type: str
             parameters = command[1:]  # type: List[str]
@@ -225,9 +238,9 @@ class Compilation:
                 mpi_call = get_mpi_call(command[0])  # type: List[str]
                 return cls._split_compiler(mpi_call + parameters, cc, cxx)
             # and 'compiler' 'parameters' is valid.
-            elif is_c_compiler(executable):
+            elif is_c_compiler(executable, cc):
                 return 'c', parameters
-            elif is_cxx_compiler(executable):
+            elif is_cxx_compiler(executable, cxx):
                 return 'c++', parameters
         return None
 
@@ -261,13 +274,13 @@ class Compilation:
                 count = IGNORED_FLAGS[arg]
                 for _ in range(count):
                     next(args)
-            elif re.match(r'^-(l|L|Wl,).+', arg):
+            elif LINKER_FLAG_PATTERN.match(arg):
                 pass
             # some parameters look like a filename, take those explicitly
             elif arg in {'-D', '-I'}:
                 result.flags.extend([arg, next(args)])
             # parameter which looks source file is taken...
-            elif re.match(r'^[^-].+', arg) and classify_source(arg):
+            elif SOURCE_FILE_PATTERN.match(arg) and classify_source(arg):
                 result.files.append(arg)
             # and consider everything else as compile option.
             else:
@@ -300,10 +313,11 @@ class CompilationDatabase:
         :param filename: the file to read from
         :returns: iterator of Compilation objects. """
 
-        with open(filename, 'r') as handle:
-            for entry in json.load(handle):
-                for compilation in Compilation.from_db_entry(entry):
-                    yield compilation
+        with open(filename, 'rb') as handle:
+            entries = json_loads(handle.read())
+        for entry in entries:
+            for compilation in Compilation.from_db_entry(entry):
+                yield compilation
 
 
 def classify_source(filename, c_compiler=True):
@@ -315,29 +329,33 @@ def classify_source(filename, c_compiler=True):
     :param c_compiler:  indicate that the compiler is a C compiler,
     :return: the language from file name extension. """
 
-    mapping = {
-        '.c': 'c' if c_compiler else 'c++',
-        '.i': 'c-cpp-output' if c_compiler else 'c++-cpp-output',
-        '.ii': 'c++-cpp-output',
-        '.m': 'objective-c',
-        '.mi': 'objective-c-cpp-output',
-        '.mm': 'objective-c++',
-        '.mii': 'objective-c++-cpp-output',
-        '.C': 'c++',
-        '.cc': 'c++',
-        '.CC': 'c++',
-        '.cp': 'c++',
-        '.cpp': 'c++',
-        '.cxx': 'c++',
-        '.c++': 'c++',
-        '.C++': 'c++',
-        '.txx': 'c++'
-    }
-
-    __, extension = os.path.splitext(os.path.basename(filename))
+    mapping = SOURCE_LANGUAGES_C if c_compiler else SOURCE_LANGUAGES_CXX
+    __, extension = os.path.splitext(filename)
     return mapping.get(extension)
 
 
+def is_wrapper(cmd):
+    # type: (str) -> bool
+    return True if COMPILER_PATTERN_WRAPPER.match(cmd) else False
+
+
+def is_mpi_wrapper(cmd):
+    # type: (str) -> bool
+    return True if COMPILER_PATTERNS_MPI_WRAPPER.match(cmd) else False
+
+
+def is_c_compiler(cmd, cc):
+    # type: (str, str) -> bool
+    return os.path.basename(cc) == cmd or \
+        COMPILER_PATTERNS_CC.match(cmd) is not None
+
+
+def is_cxx_compiler(cmd, cxx):
+    # type: (str, str) -> bool
+    return os.path.basename(cxx) == cmd or \
+        COMPILER_PATTERNS_CXX.match(cmd) is not None
+
+
 def get_mpi_call(wrapper):
     # type: (str) -> List[str]
     """ Provide information on how the underlying compiler would have been
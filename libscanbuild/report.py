@@ -14,15 +14,16 @@ import os.path
 import sys
 import shutil
 import plistlib
-import glob
 import itertools
-import json
+import concurrent.futures
 import logging
 import datetime
 import getpass
 import socket
 import argparse  # noqa: ignore=F401
 from typing import Dict, List, Tuple, Any, Set, Generator, Iterator, Optional  # noqa: ignore=F401
+from typing import Callable, Iterable  # noqa: ignore=F401
+from libscanbuild import json_loads
 from libscanbuild.clang import get_version
 
 __all__ = ['document']
@@ -250,6 +251,8 @@ def crash_report(output_dir, prefix):
 
 
 class Crash:
+    __slots__ = ('source', 'problem', 'file', 'info', 'stderr')
+
     def __init__(self,
                  source,    # type: str
                  problem,   # type: str
@@ -289,8 +292,9 @@ class Crash:
         # type: (str) -> Iterator[Crash]
         """ Generate a unique sequence of crashes from given directory. """
 
-        pattern = os.path.join(output_dir, 'failures', '*.info.txt')
-        for info_filename in glob.iglob(pattern):
+        failures_dir = os.path.join(output_dir, 'failures')
+        for entry in files_with_extension(failures_dir, '.info.txt'):
+            info_filename = entry.path
             base_filename = info_filename[0:-len('.info.txt')]
             stderr_filename = "{}.stderr.txt".format(base_filename)
 
@@ -305,6 +309,9 @@ class Crash:
 
 
 class Bug:
+    __slots__ = ('file', 'line', 'path_length', 'category', 'type',
+                 'function', 'report')
+
     def __init__(self,
                  report,     # type: str
                  attributes  # type: Dict[str, str]
@@ -331,10 +338,7 @@ class Bug:
     def __hash__(self):
         # type: (Bug) -> int
 
-        return hash(self.line) +\
-               hash(self.path_length) +\
-               hash(self.type) +\
-               hash(self.file)
+        return hash((self.line, self.path_length, self.type, self.file))
 
     def type_class(self):
         # type: (Bug) -> str
@@ -371,17 +375,48 @@ def read_bugs(output_dir, html):
     times with different compiler options. These would be better to show in
     the final report (cover) only once. """
 
-    def empty(file_name):
-        return os.stat(file_name).st_size == 0
-
     # get the right parser for the job.
     parser = parse_bug_html if html else parse_bug_plist
-    # get the input files, which are not empty.
-    pattern = os.path.join(output_dir, '*.html' if html else '*.plist')
-    bug_generators = (parser(file)
-                      for file in glob.iglob(pattern) if not empty(file))
+    # get the input files, which are analyzer reports and not empty.
+    extension = '.html' if html else '.plist'
+    files = (entry.path
+             for entry in files_with_extension(output_dir, extension)
+             if entry.name.startswith('report-') and entry.stat().st_size)
+    # parse the files parallel, but keep the order of the files.
+    bug_lists = parallel_map(lambda file: list(parser(file)), files)
+
+    return unique_bugs(itertools.chain.from_iterable(bug_lists))
+
+
+def parallel_map(function, iterable):
+    # type: (Callable[[Any], Any], Iterable[Any]) -> Iterator[Any]
+    """ Generate the results of the function applied on each element.
+
+    Report parsing is mostly waiting for I/O, threads overlap that without
+    the pickling cost of a process pool. The results are in the same order
+    as the input elements. """
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        for result in executor.map(function, iterable):
+            yield result
+
 
-    return unique_bugs(itertools.chain.from_iterable(bug_generators))
+def files_with_extension(directory, extension):
+    # type: (str, str) -> Iterator[os.DirEntry]
+    """ Generate the directory entries of files with the given extension.
+
+    It lists the directory only once, and the returned entries cache the
+    file attributes. (Hidden files are skipped, and a missing directory
+    is the same as an empty one.) """
+
+    if not os.path.isdir(directory):
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(extension) and \
+                    not entry.name.startswith('.') and \
+                    entry.is_file():
+                yield entry
 
 
 def unique_bugs(generator):
@@ -416,29 +451,35 @@ def parse_bug_plist(filename):
             })
 
 
+# bug attributes in the HTML report are in comments before the end marker.
+# (lines are right stripped by the reader, but might be indented.)
+BUG_HTML_ATTRIBUTES = {
+    'BUGTYPE': 'bug_type',
+    'BUGFILE': 'bug_file',
+    'BUGPATHLENGTH': 'bug_path_length',
+    'BUGLINE': 'bug_line',
+    'BUGCATEGORY': 'bug_category',
+    'FUNCTIONNAME': 'bug_function'
+}
+BUG_HTML_PATTERN = re.compile(
+    r'\s*<!-- (?P<key>' + '|'.join(BUG_HTML_ATTRIBUTES) +
+    r') (?P<value>.*) -->$')
+BUG_HTML_END_PATTERN = re.compile(r'<!-- BUGMETAEND -->')
+
+
 def parse_bug_html(filename):
     # type: (str) -> Generator[Bug, None, None]
     """ Parse out the bug information from HTML output. """
 
-    patterns = [re.compile(r'<!-- BUGTYPE (?P<bug_type>.*) -->$'),
-                re.compile(r'<!-- BUGFILE (?P<bug_file>.*) -->$'),
-                re.compile(r'<!-- BUGPATHLENGTH (?P<bug_path_length>.*) -->$'),
-                re.compile(r'<!-- BUGLINE (?P<bug_line>.*) -->$'),
-                re.compile(r'<!-- BUGCATEGORY (?P<bug_category>.*) -->$'),
-                re.compile(r'<!-- FUNCTIONNAME (?P<bug_function>.*) -->$')]
-    endsign = re.compile(r'<!-- BUGMETAEND -->')
-
     bug = dict()
     for line in safe_readlines(filename):
         # do not read the file further
-        if endsign.match(line):
+        if BUG_HTML_END_PATTERN.match(line):
             break
         # search for the right lines
-        for regex in patterns:
-            match = regex.match(line.strip())
-            if match:
-                bug.update(match.groupdict())
-                break
+        match = BUG_HTML_PATTERN.match(line)
+        if match:
+            bug[BUG_HTML_ATTRIBUTES[match.group('key')]] = match.group('value')
 
     yield Bug(filename, bug)
 
@@ -482,10 +523,12 @@ def copy_resource_files(output_dir):
 
 def safe_readlines(filename):
     # type: (str) -> Iterator[str]
-    """ Read and return an iterator of lines from file. """
+    """ Read and return an iterator of lines from file.
+
+    The file is read lazily, so callers can stop before the end of it. """
 
     with open(filename, mode='rb') as handler:
-        for line in handler.readlines():
+        for line in handler:
             # this is a workaround to fix windows read '\r\n' as new lines.
             yield line.decode(errors='ignore').rstrip()
 
@@ -502,18 +545,21 @@ def chop(prefix, filename):
     return result
 
 
+# translation table for the HTML escape method.
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '"': '&quot;',
+    "'": '&apos;',
+    '>': '&gt;',
+    '<': '&lt;'
+})
+
+
 def escape(text):
     # type: (str) -> str
     """ Paranoid HTML escape method. (Python version independent) """
 
-    escape_table = {
-        '&': '&amp;',
-        '"': '&quot;',
-        "'": '&apos;',
-        '>': '&gt;',
-        '<': '&lt;'
-    }
-    return ''.join(escape_table.get(c, c) for c in text)
+    return text.translate(HTML_ESCAPE_TABLE)
 
 
 def reindent(text, indent):
@@ -543,8 +589,9 @@ def commonprefix_from(filename):
     # type: (str) -> str
     """ Create file prefix from a compilation database entries. """
 
-    with open(filename, 'r') as handle:
-        return commonprefix(item['file'] for item in json.load(handle))
+    with open(filename, 'rb') as handle:
+        entries = json_loads(handle.read())
+    return commonprefix(item['file'] for item in entries)
 
 
 def commonprefix(files):
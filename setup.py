@@ -21,6 +21,9 @@ setuptools.setup(
     zip_safe=False,
     python_requires=">=3.6",
     packages=['libscanbuild', 'libear'],
+    extras_require={
+        'fast-json': ['orjson'],
+    },
     package_data={'libscanbuild': ['resources/*'],
                   'libear': ['config.h.in', 'ear.c']},
     entry_points={
@@ -174,7 +174,6 @@ class ReportFailureTest(unittest.TestCase):
             filename = os.path.join(tmp_dir, 'test.c')
             with open(filename, 'w') as handle:
                 handle.write('int main() { return 0')
-            uname_msg = ' '.join(platform.uname()).strip()
             error_msg = 'this is my error output'
             # execute test
             opts = {
@@ -199,7 +198,9 @@ class ReportFailureTest(unittest.TestCase):
                 lines = [line.strip() for line in info_handler.readlines() if
                          line.strip()]
                 self.assertEqual('Other Error', lines[1])
-                self.assertEqual(uname_msg, lines[3])
+                # the host line names this machine
+                self.assertIn(platform.node(), lines[3])
+                self.assertIn(platform.system(), lines[3])
             # error file generated and content dumped
             error_file = pp_file + '.stderr.txt'
             self.assertTrue(os.path.exists(error_file))
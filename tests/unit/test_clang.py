@@ -33,6 +33,22 @@ class ClangGetArgumentsTest(unittest.TestCase):
             self.assertTrue('NDEBUG' in result)
             self.assertTrue('var="this is it"' in result)
 
+    def test_split_arguments(self):
+        line = r' "/usr/bin/clang" "-cc1" "-D" "var=\"this is it\"" ' \
+               r'"-I" "/with space" "-DX=\\\$" "" "-o" "a.o"'
+        self.assertEqual(['/usr/bin/clang', '-cc1', '-D', 'var="this is it"',
+                          '-I', '/with space', '-DX=\\$', '', '-o', 'a.o'],
+                         sut.split_arguments(line))
+
+    def test_split_arguments_unescaped_once(self):
+        line = r'"clang" "-DA=a\\\\b" "-DB=\\ "'
+        self.assertEqual(['clang', r'-DA=a\\b', r'-DB=\ '],
+                         sut.split_arguments(line))
+
+    def test_split_arguments_not_quoted(self):
+        line = r'clang -cc1 "-D" var=\"quote -c'
+        self.assertEqual(sut.shell_split(line), sut.split_arguments(line))
+
     def test_get_clang_arguments_fails(self):
         with self.assertRaises(Exception):
             sut.get_arguments(['clang', '-x', 'c', 'notexist.c'], '.')
@@ -76,6 +92,9 @@ class ClangGetCheckersTest(unittest.TestCase):
         self.assertFalse(test('c.c'))
         self.assertFalse(test('b'))
         self.assertFalse(test('d'))
+        # the dots in checker names are not wildcards
+        self.assertFalse(test('bxb'))
+        self.assertFalse(test('c.cxc'))
 
     def test_parse_checkers(self):
         lines = [
@@ -4,8 +4,10 @@
 # This file is distributed under the University of Illinois Open Source
 # License. See LICENSE.TXT for details.
 
+import libear
 import libscanbuild.compilation as sut
 import unittest
+import os.path
 
 
 class CompilerTest(unittest.TestCase):
@@ -209,3 +211,20 @@ class SourceClassifierTest(unittest.TestCase):
         self.assert_c_source('../path/file.c', True)
         self.assert_c_source('/file.c', True)
         self.assert_c_source('./file.c', True)
+
+
+class CompilationDatabaseTest(unittest.TestCase):
+
+    def test_save_and_load(self):
+        with libear.temporary_directory() as tmp_dir:
+            source = os.path.join(tmp_dir, 'src.c')
+            with open(source, 'w') as handle:
+                handle.write('')
+            expected = [sut.Compilation(compiler='c',
+                                        flags=['-DNDEBUG'],
+                                        source=source,
+                                        directory=tmp_dir)]
+            cdb = os.path.join(tmp_dir, 'compile_commands.json')
+            sut.CompilationDatabase.save(cdb, expected)
+            result = list(sut.CompilationDatabase.load(cdb))
+            self.assertEqual(expected, result)
@@ -94,8 +94,70 @@ class ParseFileTest(unittest.TestCase):
             self.assertEqual(crash.file + '.stderr.txt', crash.stderr)
 
 
+class UniqueBugsTest(unittest.TestCase):
+
+    @staticmethod
+    def bug(line, path_length):
+        return sut.Bug('report.html', {'bug_file': 'file.c',
+                                       'bug_type': 'Division by zero',
+                                       'bug_line': line,
+                                       'bug_path_length': path_length})
+
+    def test_duplicates_removed(self):
+        bugs = [self.bug('5', '3'), self.bug('5', '3'), self.bug('7', '3')]
+        result = list(sut.unique_bugs(iter(bugs)))
+        self.assertEqual([bugs[0], bugs[2]], result)
+
+    def test_different_bugs_kept(self):
+        bugs = [self.bug('5', '3'), self.bug('3', '5')]
+        result = list(sut.unique_bugs(iter(bugs)))
+        self.assertEqual(bugs, result)
+
+    def test_swapped_line_and_path_length_hash_differently(self):
+        self.assertNotEqual(hash(self.bug('5', '3')), hash(self.bug('3', '5')))
+
+
+class ReadBugsTest(unittest.TestCase):
+
+    @staticmethod
+    def write_bug(file_name, line):
+        content = [
+            "<!-- BUGTYPE Division by zero -->",
+            "<!-- BUGFILE xx -->",
+            "<!-- BUGLINE {0} -->".format(line),
+            "<!-- BUGMETAEND -->"]
+        with open(file_name, 'w') as handle:
+            handle.writelines(line + os.linesep for line in content)
+
+    def test_only_reports_are_read(self):
+        with libear.temporary_directory() as tmp_dir:
+            self.write_bug(os.path.join(tmp_dir, 'report-a.html'), 5)
+            # non report, hidden and not html files are ignored
+            self.write_bug(os.path.join(tmp_dir, 'index.html'), 6)
+            self.write_bug(os.path.join(tmp_dir, '.report-b.html'), 7)
+            self.write_bug(os.path.join(tmp_dir, 'report-c.txt'), 8)
+            # empty report and not regular files are ignored
+            open(os.path.join(tmp_dir, 'report-d.html'), 'w').close()
+            os.mkdir(os.path.join(tmp_dir, 'report-e.html'))
+
+            result = list(sut.read_bugs(tmp_dir, True))
+            self.assertEqual([5], [bug.line for bug in result])
+
+    def test_missing_directory(self):
+        with libear.temporary_directory() as tmp_dir:
+            missing = os.path.join(tmp_dir, 'missing')
+            self.assertEqual([], list(sut.read_bugs(missing, True)))
+            self.assertEqual([], list(sut.files_with_extension(missing,
+                                                               '.html')))
+
+
 class ReportMethodTest(unittest.TestCase):
 
+    def test_escape(self):
+        self.assertEqual('plain text', sut.escape('plain text'))
+        self.assertEqual('&lt;a href=&quot;x&apos;&quot;&gt;&amp;',
+                         sut.escape('<a href="x\'">&'))
+
     @unittest.skipIf(IS_WINDOWS, 'windows has different path patterns')
     def test_chop(self):
         self.assertEqual('file', sut.chop('/prefix', '/prefix/file'))